@@ -39,8 +39,13 @@ class GeneratorStack:
         if func is None:
             return False
 
-        result = func(*self._args, self._value)
+        return self.push_result(func(*self._args, self._value))
 
+    def push_result(self, result: Any) -> bool:
+        """
+        Same as ``push()``, but takes the value already returned by a function
+        called with the fixed ``args`` and the current ``value``.
+        """
         if isinstance(result, GeneratorType):
             # Advance to the first `yield` and get the value to pass to the lower levels.
             self._value = next(result)
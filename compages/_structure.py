@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from types import GeneratorType, MappingProxyType
 from typing import Any, NewType, TypeVar, overload
 
 from ._common import GeneratorStack, get_lookup_order
@@ -7,7 +8,9 @@ from .path import PathElem
 
 
 class StructuringError(Exception):
-    def __init__(self, message: str, inner_errors: list[tuple[PathElem, "StructuringError"]] = []):
+    def __init__(
+        self, message: str, inner_errors: Sequence[tuple[PathElem, "StructuringError"]] = ()
+    ):
         super().__init__(message)
         self.message = message
         self.inner_errors = inner_errors
@@ -27,13 +30,23 @@ class StructuringError(Exception):
 def collect_messages(
     path: list[PathElem], exc: StructuringError
 ) -> list[tuple[list[PathElem], str]]:
-    result = [(path, exc.message)]
-    for path_elem, inner_exc in exc.inner_errors:
-        result.extend(collect_messages([*path, path_elem], inner_exc))
+    # Walking the tree with an explicit stack instead of recursing
+    # avoids re-extending the result lists at every nesting level.
+    result = []
+    stack = [(path, exc)]
+    while stack:
+        path, exc = stack.pop()
+        result.append((path, exc.message))
+        # Reversed, so that the inner errors are popped in their original order
+        stack.extend(
+            ([*path, path_elem], inner_exc) for path_elem, inner_exc in reversed(exc.inner_errors)
+        )
     return result
 
 
 class SequentialStructureHandler(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def applies(self, structure_into: Any, val: Any) -> bool: ...
 
@@ -45,13 +58,36 @@ _T = TypeVar("_T")
 
 
 class Structurer:
+    __slots__ = ("__weakref__", "_lookup_cache", "_lookup_handlers", "_sequential_handlers")
+
     def __init__(
         self,
         lookup_handlers: Mapping[Any, Callable[["Structurer", type, Any], Any]] = {},
         sequential_handlers: Iterable[SequentialStructureHandler] = [],
     ):
-        self._lookup_handlers = lookup_handlers
-        self._sequential_handlers = sequential_handlers
+        # Freeze the handlers so that they cannot be changed after the structurer is created.
+        self._lookup_handlers = MappingProxyType(dict(lookup_handlers))
+        self._sequential_handlers = tuple(sequential_handlers)
+        # Maps a type to the lookup handlers found for it, in the lookup order.
+        # The key includes the type of the type, since some types with different lookup orders
+        # compare equal (e.g. `typing.Optional[int] == int | None`).
+        self._lookup_cache: dict[
+            tuple[type, Any], tuple[Callable[[Structurer, type, Any], Any], ...]
+        ] = {}
+
+    def _get_lookup_handlers(
+        self, structure_into: Any
+    ) -> tuple[Callable[["Structurer", type, Any], Any], ...]:
+        key = (type(structure_into), structure_into)
+        handlers = self._lookup_cache.get(key)
+        if handlers is None:
+            handlers = tuple(
+                self._lookup_handlers[tp]
+                for tp in get_lookup_order(structure_into)
+                if tp in self._lookup_handlers
+            )
+            self._lookup_cache[key] = handlers
+        return handlers
 
     @overload
     def structure_into(self, structure_into: NewType, val: Any) -> Any: ...
@@ -60,11 +96,21 @@ class Structurer:
     def structure_into(self, structure_into: type[_T], val: Any) -> _T: ...
 
     def structure_into(self, structure_into: Any, val: Any) -> Any:
-        stack = GeneratorStack((self, structure_into), val)
-        lookup_order = get_lookup_order(structure_into)
-
-        for tp in lookup_order:
-            handler = self._lookup_handlers.get(tp, None)
+        lookup_handlers = self._get_lookup_handlers(structure_into)
+
+        # Fast path: most of the time the first lookup handler returns the result right away,
+        # and there is no need to set up a generator stack.
+        if lookup_handlers:
+            result = lookup_handlers[0](self, structure_into, val)
+            if not isinstance(result, GeneratorType):
+                return result
+            # The first handler returned a generator, so it goes to the bottom of the stack.
+            stack = GeneratorStack((self, structure_into), val)
+            stack.push_result(result)
+        else:
+            stack = GeneratorStack((self, structure_into), val)
+
+        for handler in lookup_handlers[1:]:
             if stack.push(handler):
                 return stack.result()
 
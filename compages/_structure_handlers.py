@@ -26,13 +26,17 @@ def structure_into_none(val: Any) -> None:
 def structure_into_int(val: Any) -> int:
     # Handling a special case of `bool` here since in Python `bool` is an `int`,
     # and we don't want to mix them up.
-    if not isinstance(val, int) or isinstance(val, bool):
+    # The exact type is checked first since it is the most common case, and a much faster one.
+    if type(val) is not int and (not isinstance(val, int) or type(val) is bool):
         raise StructuringError("The value must be an integer")
     return val
 
 
 @simple_structure
 def structure_into_float(val: Any) -> float:
+    # `float()` would return the same object anyway.
+    if type(val) is float:
+        return val
     # Allow integers as well, even though `int` is not a subclass of `float` in Python.
     if not isinstance(val, int | float):
         raise StructuringError("The value must be a floating-point number")
@@ -41,7 +45,8 @@ def structure_into_float(val: Any) -> float:
 
 @simple_structure
 def structure_into_bool(val: Any) -> bool:
-    if not isinstance(val, bool):
+    # `bool` cannot be subclassed, so an exact type check is enough (and is faster).
+    if type(val) is not bool:
         raise StructuringError("The value must be a boolean")
     return val
 
@@ -63,6 +68,9 @@ def structure_into_str(val: Any) -> str:
 def structure_into_union(structurer: Structurer, structure_into: type, val: Any) -> Any:
     variants = get_args(structure_into)
 
+    # Note that the variants are tried in order, and the first successful one is used.
+    # Whether a variant succeeds may depend on the value and not just on its type,
+    # so the variant cannot be looked up based on `type(val)`.
     exceptions: list[tuple[PathElem, StructuringError]] = []
     for variant in variants:
         try:
@@ -73,15 +81,35 @@ def structure_into_union(structurer: Structurer, structure_into: type, val: Any)
     raise StructuringError(f"Cannot structure into {structure_into}", exceptions)
 
 
+def _structure_homogeneous(
+    structurer: Structurer, structure_into: Any, item_type: Any, val: Any
+) -> list[Any]:
+    result = []
+    # The list is only created on failure, which is the rare case.
+    exceptions: list[tuple[PathElem, StructuringError]] | None = None
+    for index, item in enumerate(val):
+        try:
+            result.append(structurer.structure_into(item_type, item))
+        except StructuringError as exc:  # noqa: PERF203
+            if exceptions is None:
+                exceptions = []
+            exceptions.append((ListElem(index), exc))
+
+    if exceptions is not None:
+        raise StructuringError(f"Cannot structure into {structure_into}", exceptions)
+
+    return result
+
+
 def structure_into_tuple(structurer: Structurer, structure_into: type, val: Any) -> Any:
-    if not isinstance(val, list | tuple):
+    if type(val) is not list and type(val) is not tuple and not isinstance(val, list | tuple):
         raise StructuringError("Can only structure a tuple or a list into a tuple generic")
 
     elem_types = get_args(structure_into)
 
-    # Homogeneous tuples (tuple[some_type, ...])
+    # Homogeneous tuples (tuple[some_type, ...]) are structured the same way as lists
     if len(elem_types) == 2 and elem_types[1] == ...:
-        elem_types = tuple(elem_types[0] for _ in range(len(val)))
+        return tuple(_structure_homogeneous(structurer, structure_into, elem_types[0], val))
 
     if len(val) < len(elem_types):
         raise StructuringError(
@@ -93,37 +121,27 @@ def structure_into_tuple(structurer: Structurer, structure_into: type, val: Any)
         )
 
     result = []
-    exceptions: list[tuple[PathElem, StructuringError]] = []
+    exceptions: list[tuple[PathElem, StructuringError]] | None = None
     for index, (item, tp) in enumerate(zip(val, elem_types, strict=True)):
         try:
             result.append(structurer.structure_into(tp, item))
         except StructuringError as exc:  # noqa: PERF203
+            if exceptions is None:
+                exceptions = []
             exceptions.append((ListElem(index), exc))
 
-    if exceptions:
+    if exceptions is not None:
         raise StructuringError(f"Cannot structure into {structure_into}", exceptions)
 
     return tuple(result)
 
 
 def structure_into_list(structurer: Structurer, structure_into: type, val: Any) -> Any:
-    if not isinstance(val, list | tuple):
+    if type(val) is not list and type(val) is not tuple and not isinstance(val, list | tuple):
         raise StructuringError("Can only structure a tuple or a list into a list generic")
 
     (item_type,) = get_args(structure_into)
-
-    result = []
-    exceptions: list[tuple[PathElem, StructuringError]] = []
-    for index, item in enumerate(val):
-        try:
-            result.append(structurer.structure_into(item_type, item))
-        except StructuringError as exc:  # noqa: PERF203
-            exceptions.append((ListElem(index), exc))
-
-    if exceptions:
-        raise StructuringError(f"Cannot structure into {structure_into}", exceptions)
-
-    return result
+    return _structure_homogeneous(structurer, structure_into, item_type, val)
 
 
 def structure_into_dict(structurer: Structurer, structure_into: type, val: Any) -> Any:
@@ -133,7 +151,7 @@ def structure_into_dict(structurer: Structurer, structure_into: type, val: Any)
     key_type, value_type = get_args(structure_into)
 
     result = {}
-    exceptions: list[tuple[PathElem, StructuringError]] = []
+    exceptions: list[tuple[PathElem, StructuringError]] | None = None
     for key, value in val.items():
         success = True
 
@@ -141,48 +159,82 @@ def structure_into_dict(structurer: Structurer, structure_into: type, val: Any)
             structured_key = structurer.structure_into(key_type, key)
         except StructuringError as exc:
             success = False
+            if exceptions is None:
+                exceptions = []
             exceptions.append((DictKey(key), exc))
 
         try:
             structured_value = structurer.structure_into(value_type, value)
         except StructuringError as exc:
             success = False
+            if exceptions is None:
+                exceptions = []
             exceptions.append((DictValue(key), exc))
 
         if success:
             result[structured_key] = structured_value
 
-    if exceptions:
+    if exceptions is not None:
         raise StructuringError(f"Cannot structure into {structure_into}", exceptions)
 
     return result
 
 
 class StructureListIntoDataclass(SequentialStructureHandler):
+    __slots__ = ("__weakref__", "_field_cache")
+
+    def __init__(self) -> None:
+        # Maps a dataclass type to a tuple of `(name, type, default, path_elem)`
+        # for each of its fields.
+        self._field_cache: dict[Any, tuple[tuple[str, Any, Any, StructField], ...]] = {}
+
+    def _get_fields(self, structure_into: Any) -> tuple[tuple[str, Any, Any, StructField], ...]:
+        struct_fields = self._field_cache.get(structure_into)
+        if struct_fields is None:
+            struct_fields = tuple(
+                (field.name, field.type, field.default, StructField(field.name))
+                for field in fields(structure_into)
+            )
+            self._field_cache[structure_into] = struct_fields
+        return struct_fields
+
     def applies(self, structure_into: Any, val: Any) -> bool:
-        return is_dataclass(structure_into) and isinstance(val, list)
+        # Checking the value type first since it is cheaper than `is_dataclass()`.
+        # Types already in the field cache are known to be dataclasses.
+        return isinstance(val, list) and (
+            structure_into in self._field_cache or is_dataclass(structure_into)
+        )
 
     def __call__(self, structurer: Structurer, structure_into: Any, val: Any) -> Any:
         results = {}
-        exceptions: list[tuple[PathElem, StructuringError]] = []
+        exceptions: list[tuple[PathElem, StructuringError]] | None = None
 
-        struct_fields = fields(structure_into)
+        struct_fields = self._get_fields(structure_into)
 
         if len(val) > len(struct_fields):
             raise StructuringError(f"Too many fields to serialize into {structure_into}")
 
-        for i, field in enumerate(struct_fields):
-            if i < len(val):
-                try:
-                    results[field.name] = structurer.structure_into(field.type, val[i])
-                except StructuringError as exc:
-                    exceptions.append((StructField(field.name), exc))
-            elif field.default is not MISSING:
-                results[field.name] = field.default
+        # The fields present in the input
+        for item, (name, tp, _default, path_elem) in zip(
+            val, struct_fields[: len(val)], strict=True
+        ):
+            try:
+                results[name] = structurer.structure_into(tp, item)
+            except StructuringError as exc:  # noqa: PERF203
+                if exceptions is None:
+                    exceptions = []
+                exceptions.append((path_elem, exc))
+
+        # The fields missing from the input
+        for name, _tp, default, path_elem in struct_fields[len(val) :]:
+            if default is not MISSING:
+                results[name] = default
             else:
-                exceptions.append((StructField(field.name), StructuringError("Missing field")))
+                if exceptions is None:
+                    exceptions = []
+                exceptions.append((path_elem, StructuringError("Missing field")))
 
-        if exceptions:
+        if exceptions is not None:
             raise StructuringError(
                 f"Cannot structure a list into a dataclass {structure_into}", exceptions
             )
@@ -191,36 +243,65 @@ class StructureListIntoDataclass(SequentialStructureHandler):
 
 
 class StructureDictIntoDataclass(SequentialStructureHandler):
+    __slots__ = ("__weakref__", "_field_cache", "_name_converter")
+
     def __init__(
         self,
         name_converter: Callable[[str, MappingProxyType[Any, Any]], str] = lambda name,
         _metadata: name,
     ):
         self._name_converter = name_converter
+        # Maps a dataclass type to a tuple of `(name, type, val_name, default, path_elem)`
+        # for each of its fields.
+        self._field_cache: dict[Any, tuple[tuple[str, Any, str, Any, StructField], ...]] = {}
+
+    def _get_fields(
+        self, structure_into: Any
+    ) -> tuple[tuple[str, Any, str, Any, StructField], ...]:
+        struct_fields = self._field_cache.get(structure_into)
+        if struct_fields is None:
+            struct_fields = tuple(
+                (
+                    field.name,
+                    field.type,
+                    self._name_converter(field.name, field.metadata),
+                    field.default,
+                    StructField(field.name),
+                )
+                for field in fields(structure_into)
+            )
+            self._field_cache[structure_into] = struct_fields
+        return struct_fields
 
     def applies(self, structure_into: Any, val: Any) -> bool:
-        return is_dataclass(structure_into) and isinstance(val, dict)
+        return isinstance(val, dict) and (
+            structure_into in self._field_cache or is_dataclass(structure_into)
+        )
 
     def __call__(self, structurer: Structurer, structure_into: Any, val: Any) -> Any:
         results = {}
-        exceptions: list[tuple[PathElem, StructuringError]] = []
-        for field in fields(structure_into):
-            val_name = self._name_converter(field.name, field.metadata)
-            if val_name in val:
+        exceptions: list[tuple[PathElem, StructuringError]] | None = None
+        for name, tp, val_name, default, path_elem in self._get_fields(structure_into):
+            field_val = val.get(val_name, MISSING)
+            if field_val is not MISSING:
                 try:
-                    results[field.name] = structurer.structure_into(field.type, val[val_name])
+                    results[name] = structurer.structure_into(tp, field_val)
                 except StructuringError as exc:
-                    exceptions.append((StructField(field.name), exc))
-            elif field.default is not MISSING:
-                results[field.name] = field.default
+                    if exceptions is None:
+                        exceptions = []
+                    exceptions.append((path_elem, exc))
+            elif default is not MISSING:
+                results[name] = default
             else:
-                if val_name == field.name:
+                if val_name == name:
                     message = "Missing field"
                 else:
                     message = f"Missing field (`{val_name}` in the input)"
-                exceptions.append((StructField(field.name), StructuringError(message)))
+                if exceptions is None:
+                    exceptions = []
+                exceptions.append((path_elem, StructuringError(message)))
 
-        if exceptions:
+        if exceptions is not None:
             raise StructuringError(
                 f"Cannot structure a dict into a dataclass {structure_into}", exceptions
             )
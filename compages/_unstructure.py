@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from types import GeneratorType, MappingProxyType
 from typing import Any
 
 from ._common import GeneratorStack, get_lookup_order
@@ -8,7 +9,7 @@ from .path import PathElem
 
 class UnstructuringError(Exception):
     def __init__(
-        self, message: str, inner_errors: list[tuple[PathElem, "UnstructuringError"]] = []
+        self, message: str, inner_errors: Sequence[tuple[PathElem, "UnstructuringError"]] = ()
     ):
         super().__init__(message)
         self.message = message
@@ -29,13 +30,23 @@ class UnstructuringError(Exception):
 def collect_messages(
     path: list[PathElem], exc: UnstructuringError
 ) -> list[tuple[list[PathElem], str]]:
-    result = [(path, exc.message)]
-    for path_elem, inner_exc in exc.inner_errors:
-        result.extend(collect_messages([*path, path_elem], inner_exc))
+    # Walking the tree with an explicit stack instead of recursing
+    # avoids re-extending the result lists at every nesting level.
+    result = []
+    stack = [(path, exc)]
+    while stack:
+        path, exc = stack.pop()
+        result.append((path, exc.message))
+        # Reversed, so that the inner errors are popped in their original order
+        stack.extend(
+            ([*path, path_elem], inner_exc) for path_elem, inner_exc in reversed(exc.inner_errors)
+        )
     return result
 
 
 class SequentialUnstructureHandler(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def applies(self, unstructure_as: Any, val: Any) -> bool: ...
 
@@ -44,20 +55,53 @@ class SequentialUnstructureHandler(ABC):
 
 
 class Unstructurer:
+    __slots__ = ("__weakref__", "_lookup_cache", "_lookup_handlers", "_sequential_handlers")
+
     def __init__(
         self,
         lookup_handlers: Mapping[Any, Callable[["Unstructurer", Any, Any], Any]] = {},
         sequential_handlers: Iterable[SequentialUnstructureHandler] = [],
     ):
-        self._lookup_handlers = dict(lookup_handlers)
-        self._sequential_handlers = list(sequential_handlers)
+        # Freeze the handlers so that they cannot be changed after the unstructurer is created.
+        self._lookup_handlers = MappingProxyType(dict(lookup_handlers))
+        self._sequential_handlers = tuple(sequential_handlers)
+        # Maps a type to the lookup handlers found for it, in the lookup order.
+        # The key includes the type of the type, since some types with different lookup orders
+        # compare equal (e.g. `typing.Optional[int] == int | None`).
+        self._lookup_cache: dict[
+            tuple[type, Any], tuple[Callable[[Unstructurer, Any, Any], Any], ...]
+        ] = {}
+
+    def _get_lookup_handlers(
+        self, unstructure_as: Any
+    ) -> tuple[Callable[["Unstructurer", Any, Any], Any], ...]:
+        key = (type(unstructure_as), unstructure_as)
+        handlers = self._lookup_cache.get(key)
+        if handlers is None:
+            handlers = tuple(
+                self._lookup_handlers[tp]
+                for tp in get_lookup_order(unstructure_as)
+                if tp in self._lookup_handlers
+            )
+            self._lookup_cache[key] = handlers
+        return handlers
 
     def unstructure_as(self, unstructure_as: Any, val: Any) -> Any:
-        stack = GeneratorStack((self, unstructure_as), val)
-        lookup_order = get_lookup_order(unstructure_as)
-
-        for tp in lookup_order:
-            handler = self._lookup_handlers.get(tp, None)
+        lookup_handlers = self._get_lookup_handlers(unstructure_as)
+
+        # Fast path: most of the time the first lookup handler returns the result right away,
+        # and there is no need to set up a generator stack.
+        if lookup_handlers:
+            result = lookup_handlers[0](self, unstructure_as, val)
+            if not isinstance(result, GeneratorType):
+                return result
+            # The first handler returned a generator, so it goes to the bottom of the stack.
+            stack = GeneratorStack((self, unstructure_as), val)
+            stack.push_result(result)
+        else:
+            stack = GeneratorStack((self, unstructure_as), val)
+
+        for handler in lookup_handlers[1:]:
             if stack.push(handler):
                 return stack.result()
 
@@ -45,7 +45,8 @@ def unstructure_as_none(_val: None) -> None:
 def unstructure_as_int(val: int) -> int:
     # Handling a special case of `bool` here since in Python `bool` is an `int`,
     # and we don't want to mix them up.
-    if isinstance(val, bool):
+    # `bool` cannot be subclassed, so an exact type check is enough (and is faster).
+    if type(val) is bool:
         raise UnstructuringError("The value must be of type `int`")
     return int(val)
 
@@ -73,6 +74,9 @@ def unstructure_as_str(val: str) -> str:
 def unstructure_as_union(unstructurer: Unstructurer, unstructure_as: Any, val: Any) -> Any:
     variants = get_args(unstructure_as)
 
+    # Note that the variants are tried in order, and the first successful one is used.
+    # Whether a variant succeeds may depend on the value and not just on its type,
+    # so the variant cannot be cached based on `type(val)`.
     exceptions: list[tuple[PathElem, UnstructuringError]] = []
     for variant in variants:
         try:
@@ -83,15 +87,36 @@ def unstructure_as_union(unstructurer: Unstructurer, unstructure_as: Any, val: A
     raise UnstructuringError(f"Cannot unstructure as {unstructure_as}", exceptions)
 
 
+def _unstructure_homogeneous(
+    unstructurer: Unstructurer, unstructure_as: Any, item_type: Any, val: Any
+) -> list[Any]:
+    result = []
+    # The list is only created on failure, which is the rare case.
+    exceptions: list[tuple[PathElem, UnstructuringError]] | None = None
+    for index, item in enumerate(val):
+        try:
+            result.append(unstructurer.unstructure_as(item_type, item))
+        except UnstructuringError as exc:  # noqa: PERF203
+            if exceptions is None:
+                exceptions = []
+            exceptions.append((ListElem(index), exc))
+
+    if exceptions is not None:
+        raise UnstructuringError(f"Cannot unstructure as {unstructure_as}", exceptions)
+
+    return result
+
+
 def unstructure_as_tuple(unstructurer: Unstructurer, unstructure_as: Any, val: Any) -> Any:
-    if not isinstance(val, Sequence):
+    # Checking the common exact types first since it is much faster than an ABC `isinstance()`.
+    if type(val) is not list and type(val) is not tuple and not isinstance(val, Sequence):
         raise UnstructuringError("Can only unstructure a Sequence as a tuple")
 
     elem_types = get_args(unstructure_as)
 
-    # Homogeneous tuples (tuple[some_type, ...])
+    # Homogeneous tuples (tuple[some_type, ...]) are unstructured the same way as lists
     if len(elem_types) == 2 and elem_types[1] == ...:
-        elem_types = tuple(elem_types[0] for _ in range(len(val)))
+        return _unstructure_homogeneous(unstructurer, unstructure_as, elem_types[0], val)
 
     if len(val) < len(elem_types):
         raise UnstructuringError(
@@ -103,119 +128,160 @@ def unstructure_as_tuple(unstructurer: Unstructurer, unstructure_as: Any, val: A
         )
 
     result = []
-    exceptions: list[tuple[PathElem, UnstructuringError]] = []
+    exceptions: list[tuple[PathElem, UnstructuringError]] | None = None
     for index, (item, tp) in enumerate(zip(val, elem_types, strict=True)):
         try:
             result.append(unstructurer.unstructure_as(tp, item))
         except UnstructuringError as exc:  # noqa: PERF203
+            if exceptions is None:
+                exceptions = []
             exceptions.append((ListElem(index), exc))
 
-    if exceptions:
+    if exceptions is not None:
         raise UnstructuringError(f"Cannot unstructure as {unstructure_as}", exceptions)
 
     return result
 
 
 def unstructure_as_dict(unstructurer: Unstructurer, unstructure_as: type, val: Any) -> Any:
-    if not isinstance(val, Mapping):
+    if type(val) is not dict and not isinstance(val, Mapping):
         raise UnstructuringError("Can only unstructure a Mapping as a dict")
 
     key_type, value_type = get_args(unstructure_as)
 
     result = {}
-    exceptions: list[tuple[PathElem, UnstructuringError]] = []
+    exceptions: list[tuple[PathElem, UnstructuringError]] | None = None
     for key, value in val.items():
         success = True
         try:
             unstructured_key = unstructurer.unstructure_as(key_type, key)
         except UnstructuringError as exc:
             success = False
+            if exceptions is None:
+                exceptions = []
             exceptions.append((DictKey(key), exc))
 
         try:
             unstructured_value = unstructurer.unstructure_as(value_type, value)
         except UnstructuringError as exc:
             success = False
+            if exceptions is None:
+                exceptions = []
             exceptions.append((DictValue(key), exc))
 
         if success:
             result[unstructured_key] = unstructured_value
 
-    if exceptions:
+    if exceptions is not None:
         raise UnstructuringError(f"Cannot unstructure as {unstructure_as}", exceptions)
 
     return result
 
 
-def unstructure_as_list(unstructurer: Unstructurer, unstructure_as: type, val: list[Any]) -> Any:
-    if not isinstance(val, Sequence):
+def unstructure_as_list(unstructurer: Unstructurer, unstructure_as: type, val: Any) -> Any:
+    if type(val) is not list and type(val) is not tuple and not isinstance(val, Sequence):
         raise UnstructuringError("Can only unstructure a Sequence as a list")
 
     (item_type,) = get_args(unstructure_as)
-
-    result = []
-    exceptions: list[tuple[PathElem, UnstructuringError]] = []
-    for index, item in enumerate(val):
-        try:
-            result.append(unstructurer.unstructure_as(item_type, item))
-        except UnstructuringError as exc:  # noqa: PERF203
-            exceptions.append((ListElem(index), exc))
-
-    if exceptions:
-        raise UnstructuringError(f"Cannot unstructure as {unstructure_as}", exceptions)
-
-    return result
+    return _unstructure_homogeneous(unstructurer, unstructure_as, item_type, val)
 
 
 class UnstructureDataclassToDict(SequentialUnstructureHandler):
+    __slots__ = ("__weakref__", "_field_cache", "_name_converter")
+
     def __init__(
         self,
         name_converter: Callable[[str, MappingProxyType[Any, Any]], str] = lambda name,
         _metadata: name,
     ):
         self._name_converter = name_converter
+        # Maps a dataclass type to a tuple of `(name, type, result_name, default, path_elem)`
+        # for each of its fields.
+        self._field_cache: dict[Any, tuple[tuple[str, Any, str, Any, StructField], ...]] = {}
+
+    def _get_fields(
+        self, unstructure_as: Any
+    ) -> tuple[tuple[str, Any, str, Any, StructField], ...]:
+        struct_fields = self._field_cache.get(unstructure_as)
+        if struct_fields is None:
+            struct_fields = tuple(
+                (
+                    field.name,
+                    field.type,
+                    self._name_converter(field.name, field.metadata),
+                    field.default,
+                    StructField(field.name),
+                )
+                for field in fields(unstructure_as)
+            )
+            self._field_cache[unstructure_as] = struct_fields
+        return struct_fields
 
     def applies(self, unstructure_as: Any, val: Any) -> bool:
-        return is_dataclass(unstructure_as) and isinstance(val, unstructure_as)
+        # Types already in the field cache are known to be dataclasses.
+        if unstructure_as not in self._field_cache and not is_dataclass(unstructure_as):
+            return False
+        return isinstance(val, unstructure_as)
 
     def __call__(self, unstructurer: Unstructurer, unstructure_as: Any, val: Any) -> Any:
         result = {}
-        exceptions: list[tuple[PathElem, UnstructuringError]] = []
-        for field in fields(unstructure_as):
-            result_name = self._name_converter(field.name, field.metadata)
-            value = getattr(val, field.name)
+        exceptions: list[tuple[PathElem, UnstructuringError]] | None = None
+        for name, tp, result_name, default, path_elem in self._get_fields(unstructure_as):
+            value = getattr(val, name)
             # If the value field is equal to the default one, don't add it to the result.
             try:
-                if field.default is not MISSING and value == field.default:
+                if default is not MISSING and value == default:
                     continue
             # On the off-chance the comparison is strict and raises an exception on type mismatch
             except Exception:  # noqa: S110, BLE001
                 pass
             try:
-                result[result_name] = unstructurer.unstructure_as(field.type, value)
+                result[result_name] = unstructurer.unstructure_as(tp, value)
             except UnstructuringError as exc:
-                exceptions.append((StructField(field.name), exc))
+                if exceptions is None:
+                    exceptions = []
+                exceptions.append((path_elem, exc))
 
-        if exceptions:
+        if exceptions is not None:
             raise UnstructuringError(f"Cannot unstructure as {unstructure_as}", exceptions)
 
         return result
 
 
 class UnstructureDataclassToList(SequentialUnstructureHandler):
+    __slots__ = ("__weakref__", "_field_cache")
+
+    def __init__(self) -> None:
+        # Maps a dataclass type to a tuple of `(name, type, path_elem)` for each of its fields.
+        self._field_cache: dict[Any, tuple[tuple[str, Any, StructField], ...]] = {}
+
+    def _get_fields(self, unstructure_as: Any) -> tuple[tuple[str, Any, StructField], ...]:
+        struct_fields = self._field_cache.get(unstructure_as)
+        if struct_fields is None:
+            struct_fields = tuple(
+                (field.name, field.type, StructField(field.name))
+                for field in fields(unstructure_as)
+            )
+            self._field_cache[unstructure_as] = struct_fields
+        return struct_fields
+
     def applies(self, unstructure_as: Any, val: Any) -> bool:
-        return is_dataclass(unstructure_as) and isinstance(val, unstructure_as)
+        if unstructure_as not in self._field_cache and not is_dataclass(unstructure_as):
+            return False
+        return isinstance(val, unstructure_as)
 
     def __call__(self, unstructurer: Unstructurer, unstructure_as: Any, val: Any) -> Any:
         result = []
-        exceptions: list[tuple[PathElem, UnstructuringError]] = []
-        for field in fields(unstructure_as):
+        exceptions: list[tuple[PathElem, UnstructuringError]] | None = None
+        for name, tp, path_elem in self._get_fields(unstructure_as):
             try:
-                result.append(unstructurer.unstructure_as(field.type, getattr(val, field.name)))
+                result.append(unstructurer.unstructure_as(tp, getattr(val, name)))
             except UnstructuringError as exc:  # noqa: PERF203
-                exceptions.append((StructField(field.name), exc))
+                if exceptions is None:
+                    exceptions = []
+                exceptions.append((path_elem, exc))
 
-        if exceptions:
+        if exceptions is not None:
             raise UnstructuringError(f"Cannot unstructure as {unstructure_as}", exceptions)
 
         return result
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StructField:
     """A structure field."""
 
@@ -12,7 +12,7 @@ class StructField:
         return self.name
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UnionVariant:
     """A union variant."""
 
@@ -22,7 +22,7 @@ class UnionVariant:
         return f"<{self.type_.__name__}>"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ListElem:
     """A list element."""
 
@@ -32,7 +32,7 @@ class ListElem:
         return f"[{self.index}]"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DictKey:
     """A dictionary key."""
 
@@ -42,7 +42,7 @@ class DictKey:
         return f"key({self.key})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DictValue:
     """A dictionary value."""
 
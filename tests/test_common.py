@@ -31,6 +31,21 @@ def test_normal_operation():
     assert stack.result() == ["a", "b", "d", "c"]
 
 
+def test_push_result():
+    args = (1, 2)
+    stack = GeneratorStack(args, ["a"])
+
+    def f1(arg1, arg2, val):
+        assert (arg1, arg2) == args
+        new_val = yield [*val, "b"]
+        return [*new_val, "c"]
+
+    # Pushing the result of a call is the same as pushing the function
+    assert not stack.push_result(f1(*args, ["a"]))
+    assert stack.push_result(["d"])
+    assert stack.result() == ["d", "c"]
+
+
 def test_multiple_yields():
     args = (1, 2)
     stack = GeneratorStack(args, ["a"])
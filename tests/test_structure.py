@@ -1,17 +1,22 @@
+import copy
+import pickle
 import re
+import weakref
 from dataclasses import dataclass
 from types import UnionType
-from typing import NewType
+from typing import NewType, Optional
 
 import pytest
 from compages import (
     StructureDictIntoDataclass,
+    StructureListIntoDataclass,
     Structurer,
     StructuringError,
     simple_structure,
     structure_into_dict,
     structure_into_int,
     structure_into_list,
+    structure_into_none,
     structure_into_str,
     structure_into_union,
 )
@@ -32,14 +37,17 @@ def structure_hex_int(val):
 
 # TODO (#5): duplicate
 def assert_exception_matches(exc, reference_exc):
-    assert isinstance(exc, StructuringError)
-    assert re.match(reference_exc.message, exc.message)
-    assert len(exc.inner_errors) == len(reference_exc.inner_errors)
-    for (inner_path, inner_exc), (ref_path, ref_exc) in zip(
-        exc.inner_errors, reference_exc.inner_errors, strict=True
-    ):
-        assert inner_path == ref_path
-        assert_exception_matches(inner_exc, ref_exc)
+    stack = [(exc, reference_exc)]
+    while stack:
+        exc, reference_exc = stack.pop()
+        assert isinstance(exc, StructuringError)
+        assert re.match(reference_exc.message, exc.message)
+        assert len(exc.inner_errors) == len(reference_exc.inner_errors)
+        for (inner_path, inner_exc), (ref_path, ref_exc) in zip(
+            exc.inner_errors, reference_exc.inner_errors, strict=True
+        ):
+            assert inner_path == ref_path
+            stack.append((inner_exc, ref_exc))
 
 
 def test_structure_routing():
@@ -143,6 +151,38 @@ def test_structure_routing_handler_not_found():
     assert_exception_matches(exc.value, expected)
 
 
+def test_structure_handlers_are_copied():
+    lookup_handlers = {int: structure_into_int}
+    structurer = Structurer(lookup_handlers=lookup_handlers)
+
+    # Modifying the original mapping does not affect the structurer
+    lookup_handlers[str] = structure_into_str
+    with pytest.raises(
+        StructuringError, match="No handlers registered to structure into <class 'str'>"
+    ):
+        structurer.structure_into(str, "a")
+
+
+def test_structure_equal_types_with_different_lookup_orders():
+    # `Optional[int]` and `int | None` compare equal, but only the latter has `UnionType`
+    # in its lookup order, so they must not share the cached lookup handlers.
+    lookup_handlers = {
+        UnionType: structure_into_union,
+        int: structure_into_int,
+        type(None): structure_into_none,
+    }
+
+    structurer = Structurer(lookup_handlers=lookup_handlers)
+    with pytest.raises(StructuringError, match="No handlers registered"):
+        structurer.structure_into(Optional[int], 1)  # noqa: UP045
+    assert structurer.structure_into(int | None, 1) == 1
+
+    structurer = Structurer(lookup_handlers=lookup_handlers)
+    assert structurer.structure_into(int | None, 1) == 1
+    with pytest.raises(StructuringError, match="No handlers registered"):
+        structurer.structure_into(Optional[int], 1)  # noqa: UP045
+
+
 def test_error_rendering():
     @dataclass
     class Inner:
@@ -237,3 +277,18 @@ Cannot structure a dict into a dataclass <class 'test_structure.test_error_rende
 """.strip()  # noqa: E501
 
     assert str(exc.value) == exc_str
+
+
+def test_error_copy_and_pickle():
+    # Errors can be copied and passed between processes without losing the inner errors
+    error = StructuringError("Outer error", [(StructField("x"), StructuringError("Inner error"))])
+    assert_exception_matches(copy.copy(error), error)
+    assert_exception_matches(pickle.loads(pickle.dumps(error)), error)  # noqa: S301
+
+
+def test_weakref():
+    # Slotted classes still support weak references
+    structurer = Structurer()
+    assert weakref.ref(structurer)() is structurer
+    for handler in (StructureDictIntoDataclass(), StructureListIntoDataclass()):
+        assert weakref.ref(handler)() is handler
@@ -1,6 +1,7 @@
 import re
 from dataclasses import dataclass
 from types import UnionType
+from typing import NewType, Union
 
 import pytest
 from compages import (
@@ -8,6 +9,7 @@ from compages import (
     StructureListIntoDataclass,
     Structurer,
     StructuringError,
+    simple_structure,
     structure_into_bool,
     structure_into_bytes,
     structure_into_dict,
@@ -24,14 +26,17 @@ from compages.path import DictKey, DictValue, ListElem, StructField, UnionVarian
 
 # TODO (#5): duplicate
 def assert_exception_matches(exc, reference_exc):
-    assert isinstance(exc, StructuringError)
-    assert re.match(reference_exc.message, exc.message)
-    assert len(exc.inner_errors) == len(reference_exc.inner_errors)
-    for (inner_path, inner_exc), (ref_path, ref_exc) in zip(
-        exc.inner_errors, reference_exc.inner_errors, strict=True
-    ):
-        assert inner_path == ref_path
-        assert_exception_matches(inner_exc, ref_exc)
+    stack = [(exc, reference_exc)]
+    while stack:
+        exc, reference_exc = stack.pop()
+        assert isinstance(exc, StructuringError)
+        assert re.match(reference_exc.message, exc.message)
+        assert len(exc.inner_errors) == len(reference_exc.inner_errors)
+        for (inner_path, inner_exc), (ref_path, ref_exc) in zip(
+            exc.inner_errors, reference_exc.inner_errors, strict=True
+        ):
+            assert inner_path == ref_path
+            stack.append((inner_exc, ref_exc))
 
 
 def test_structure_into_none():
@@ -130,6 +135,37 @@ def test_structure_into_union():
     assert_exception_matches(exc.value, expected)
 
 
+def test_structure_into_union_order():
+    PositiveInt = NewType("PositiveInt", int)
+
+    @simple_structure
+    def structure_positive_int(val):
+        if not isinstance(val, int) or val <= 0:
+            raise StructuringError("The value must be a positive integer")
+        return f"+{val}"
+
+    # Note that a union with a newtype is a `typing.Union`, not a `types.UnionType`
+    structurer = Structurer(
+        lookup_handlers={
+            Union: structure_into_union,
+            list: structure_into_list,
+            PositiveInt: structure_positive_int,
+            int: structure_into_int,
+        }
+    )
+
+    # The first variant that succeeds is used, even if the previous value
+    # of the same type was structured into a different variant.
+    assert structurer.structure_into(PositiveInt | int, -1) == -1
+    assert structurer.structure_into(PositiveInt | int, 1) == "+1"
+
+    # Unions with the same variants in a different order compare equal,
+    # but the variants must still be tried in the order of each particular union.
+    assert structurer.structure_into(int | PositiveInt, 1) == 1
+    assert structurer.structure_into(list[PositiveInt | int], [1]) == ["+1"]
+    assert structurer.structure_into(list[int | PositiveInt], [1]) == [1]
+
+
 def test_structure_into_tuple():
     structurer = Structurer(
         lookup_handlers={
@@ -223,6 +259,36 @@ def test_structure_into_dict():
     assert_exception_matches(exc.value, expected)
 
 
+def test_structure_into_nested_collections_error():
+    structured = []
+
+    @simple_structure
+    def structure_into_recorded_int(val):
+        structured.append(val)
+        if not isinstance(val, int):
+            raise StructuringError("The value must be an integer")
+        return val
+
+    structurer = Structurer(
+        lookup_handlers={
+            list: structure_into_list,
+            tuple: structure_into_tuple,
+            dict: structure_into_dict,
+            int: structure_into_recorded_int,
+        }
+    )
+
+    # Every element is only structured once, even if the error propagates through several levels
+    with pytest.raises(StructuringError):
+        structurer.structure_into(list[dict[int, list[int]]], [{1: [2, "a"]}, {3: [4]}])
+    assert structured == [1, 2, "a", 3, 4]
+
+    structured.clear()
+    with pytest.raises(StructuringError):
+        structurer.structure_into(tuple[int, tuple[int, int]], [1, [2, "a"]])
+    assert structured == [1, 2, "a"]
+
+
 def test_structure_dataclass_from_list():
     structurer = Structurer(
         lookup_handlers={int: structure_into_int, str: structure_into_str},
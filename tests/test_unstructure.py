@@ -1,17 +1,22 @@
+import copy
+import pickle
 import re
+import weakref
 from dataclasses import dataclass
 from types import UnionType
-from typing import NewType
+from typing import NewType, Optional
 
 import pytest
 from compages import (
     UnstructureDataclassToDict,
+    UnstructureDataclassToList,
     Unstructurer,
     UnstructuringError,
     simple_unstructure,
     unstructure_as_dict,
     unstructure_as_int,
     unstructure_as_list,
+    unstructure_as_none,
     unstructure_as_str,
     unstructure_as_union,
 )
@@ -25,14 +30,17 @@ OtherInt = NewType("OtherInt", int)
 
 # TODO (#5): duplicate
 def assert_exception_matches(exc, reference_exc):
-    assert isinstance(exc, UnstructuringError)
-    assert re.match(reference_exc.message, exc.message)
-    assert len(exc.inner_errors) == len(reference_exc.inner_errors)
-    for (inner_path, inner_exc), (ref_path, ref_exc) in zip(
-        exc.inner_errors, reference_exc.inner_errors, strict=True
-    ):
-        assert inner_path == ref_path
-        assert_exception_matches(inner_exc, ref_exc)
+    stack = [(exc, reference_exc)]
+    while stack:
+        exc, reference_exc = stack.pop()
+        assert isinstance(exc, UnstructuringError)
+        assert re.match(reference_exc.message, exc.message)
+        assert len(exc.inner_errors) == len(reference_exc.inner_errors)
+        for (inner_path, inner_exc), (ref_path, ref_exc) in zip(
+            exc.inner_errors, reference_exc.inner_errors, strict=True
+        ):
+            assert inner_path == ref_path
+            stack.append((inner_exc, ref_exc))
 
 
 @simple_unstructure
@@ -43,7 +51,7 @@ def unstructure_as_hex_int(val):
 def test_unstructure_routing():
     # A smoke test for a combination of types requiring different handling.
 
-    @dataclass
+    @dataclass(slots=True)
     class Container:
         # a regular type, will have a handler for it
         regular_int: int
@@ -137,14 +145,120 @@ def test_unstructure_routing_handler_not_found():
     assert_exception_matches(exc.value, expected)
 
 
+def test_unstructure_handlers_are_copied():
+    lookup_handlers = {int: unstructure_as_int}
+    unstructurer = Unstructurer(lookup_handlers=lookup_handlers)
+
+    # Modifying the original mapping does not affect the unstructurer
+    lookup_handlers[str] = unstructure_as_str
+    with pytest.raises(
+        UnstructuringError, match="No handlers registered to unstructure as <class 'str'>"
+    ):
+        unstructurer.unstructure_as(str, "a")
+
+
+def test_unstructure_equal_types_with_different_lookup_orders():
+    # `Optional[int]` and `int | None` compare equal, but only the latter has `UnionType`
+    # in its lookup order, so they must not share the cached lookup handlers.
+    lookup_handlers = {
+        UnionType: unstructure_as_union,
+        int: unstructure_as_int,
+        type(None): unstructure_as_none,
+    }
+
+    unstructurer = Unstructurer(lookup_handlers=lookup_handlers)
+    with pytest.raises(UnstructuringError, match="No handlers registered"):
+        unstructurer.unstructure_as(Optional[int], 1)  # noqa: UP045
+    assert unstructurer.unstructure_as(int | None, 1) == 1
+
+    unstructurer = Unstructurer(lookup_handlers=lookup_handlers)
+    assert unstructurer.unstructure_as(int | None, 1) == 1
+    with pytest.raises(UnstructuringError, match="No handlers registered"):
+        unstructurer.unstructure_as(Optional[int], 1)  # noqa: UP045
+
+
+ERROR_RENDERING_EXPECTED = UnstructuringError(
+    "Cannot unstructure as",
+    [
+        (StructField("x"), UnstructuringError("The value must be of type `int`")),
+        (
+            StructField("y"),
+            UnstructuringError(
+                "Cannot unstructure as",
+                [
+                    (
+                        StructField("u"),
+                        UnstructuringError(
+                            r"Cannot unstructure as int | str",
+                            [
+                                (
+                                    UnionVariant(int),
+                                    UnstructuringError("The value must be of type `int`"),
+                                ),
+                                (
+                                    UnionVariant(str),
+                                    UnstructuringError("The value must be of type `str`"),
+                                ),
+                            ],
+                        ),
+                    ),
+                    (
+                        StructField("d"),
+                        UnstructuringError(
+                            r"Cannot unstructure as dict\[int, str\]",
+                            [
+                                (
+                                    DictKey("a"),
+                                    UnstructuringError("The value must be of type `int`"),
+                                ),
+                                (
+                                    DictValue(1),
+                                    UnstructuringError("The value must be of type `str`"),
+                                ),
+                            ],
+                        ),
+                    ),
+                    (
+                        StructField("lst"),
+                        UnstructuringError(
+                            r"Cannot unstructure as list\[int\]",
+                            [
+                                (
+                                    ListElem(1),
+                                    UnstructuringError("The value must be of type `int`"),
+                                )
+                            ],
+                        ),
+                    ),
+                ],
+            ),
+        ),
+    ],
+)
+
+ERROR_RENDERING_EXPECTED_STR = """
+Cannot unstructure as <class 'test_unstructure.test_error_rendering.<locals>.Outer'>
+  x: The value must be of type `int`
+  y: Cannot unstructure as <class 'test_unstructure.test_error_rendering.<locals>.Inner'>
+    y.u: Cannot unstructure as int | str
+      y.u.<int>: The value must be of type `int`
+      y.u.<str>: The value must be of type `str`
+    y.d: Cannot unstructure as dict[int, str]
+      y.d.key(a): The value must be of type `int`
+      y.d.[1]: The value must be of type `str`
+    y.lst: Cannot unstructure as list[int]
+      y.lst.[1]: The value must be of type `int`
+""".strip()
+
+
 def test_error_rendering():
-    @dataclass
+    @dataclass(slots=True)
     class Inner:
         u: int | str
         d: dict[int, str]
         lst: list[int]
 
-    @dataclass
+    @dataclass(slots=True)
     class Outer:
         x: int
         y: Inner
@@ -163,79 +277,23 @@ def test_error_rendering():
     data = Outer(x="a", y=Inner(u=1.2, d={"a": "b", 1: 2}, lst=[1, "a"]))
     with pytest.raises(UnstructuringError) as exc:
         unstructurer.unstructure_as(Outer, data)
-    expected = UnstructuringError(
-        "Cannot unstructure as",
-        [
-            (StructField("x"), UnstructuringError("The value must be of type `int`")),
-            (
-                StructField("y"),
-                UnstructuringError(
-                    "Cannot unstructure as",
-                    [
-                        (
-                            StructField("u"),
-                            UnstructuringError(
-                                r"Cannot unstructure as int | str",
-                                [
-                                    (
-                                        UnionVariant(int),
-                                        UnstructuringError("The value must be of type `int`"),
-                                    ),
-                                    (
-                                        UnionVariant(str),
-                                        UnstructuringError("The value must be of type `str`"),
-                                    ),
-                                ],
-                            ),
-                        ),
-                        (
-                            StructField("d"),
-                            UnstructuringError(
-                                r"Cannot unstructure as dict\[int, str\]",
-                                [
-                                    (
-                                        DictKey("a"),
-                                        UnstructuringError("The value must be of type `int`"),
-                                    ),
-                                    (
-                                        DictValue(1),
-                                        UnstructuringError("The value must be of type `str`"),
-                                    ),
-                                ],
-                            ),
-                        ),
-                        (
-                            StructField("lst"),
-                            UnstructuringError(
-                                r"Cannot unstructure as list\[int\]",
-                                [
-                                    (
-                                        ListElem(1),
-                                        UnstructuringError("The value must be of type `int`"),
-                                    )
-                                ],
-                            ),
-                        ),
-                    ],
-                ),
-            ),
-        ],
-    )
+    assert_exception_matches(exc.value, ERROR_RENDERING_EXPECTED)
 
-    assert_exception_matches(exc.value, expected)
+    assert str(exc.value) == ERROR_RENDERING_EXPECTED_STR
+
+
+def test_error_copy_and_pickle():
+    # Errors can be copied and passed between processes without losing the inner errors
+    error = UnstructuringError(
+        "Outer error", [(StructField("x"), UnstructuringError("Inner error"))]
+    )
+    assert_exception_matches(copy.copy(error), error)
+    assert_exception_matches(pickle.loads(pickle.dumps(error)), error)  # noqa: S301
 
-    exc_str = """
-Cannot unstructure as <class 'test_unstructure.test_error_rendering.<locals>.Outer'>
-  x: The value must be of type `int`
-  y: Cannot unstructure as <class 'test_unstructure.test_error_rendering.<locals>.Inner'>
-    y.u: Cannot unstructure as int | str
-      y.u.<int>: The value must be of type `int`
-      y.u.<str>: The value must be of type `str`
-    y.d: Cannot unstructure as dict[int, str]
-      y.d.key(a): The value must be of type `int`
-      y.d.[1]: The value must be of type `str`
-    y.lst: Cannot unstructure as list[int]
-      y.lst.[1]: The value must be of type `int`
-""".strip()
 
-    assert str(exc.value) == exc_str
+def test_weakref():
+    # Slotted classes still support weak references
+    unstructurer = Unstructurer()
+    assert weakref.ref(unstructurer)() is unstructurer
+    for handler in (UnstructureDataclassToDict(), UnstructureDataclassToList()):
+        assert weakref.ref(handler)() is handler
@@ -1,7 +1,7 @@
 import re
 from dataclasses import dataclass
 from types import UnionType
-from typing import NewType
+from typing import NewType, Union
 
 import pytest
 from compages import (
@@ -27,14 +27,17 @@ from compages.path import DictKey, DictValue, ListElem, StructField, UnionVarian
 
 # TODO (#5): duplicate
 def assert_exception_matches(exc, reference_exc):
-    assert isinstance(exc, UnstructuringError)
-    assert re.match(reference_exc.message, exc.message)
-    assert len(exc.inner_errors) == len(reference_exc.inner_errors)
-    for (inner_path, inner_exc), (ref_path, ref_exc) in zip(
-        exc.inner_errors, reference_exc.inner_errors, strict=True
-    ):
-        assert inner_path == ref_path
-        assert_exception_matches(inner_exc, ref_exc)
+    stack = [(exc, reference_exc)]
+    while stack:
+        exc, reference_exc = stack.pop()
+        assert isinstance(exc, UnstructuringError)
+        assert re.match(reference_exc.message, exc.message)
+        assert len(exc.inner_errors) == len(reference_exc.inner_errors)
+        for (inner_path, inner_exc), (ref_path, ref_exc) in zip(
+            exc.inner_errors, reference_exc.inner_errors, strict=True
+        ):
+            assert inner_path == ref_path
+            stack.append((inner_exc, ref_exc))
 
 
 def test_simple_typechecked_unstructure():
@@ -148,6 +151,37 @@ def test_unstructure_as_union():
     assert_exception_matches(exc.value, expected)
 
 
+def test_unstructure_as_union_order():
+    PositiveInt = NewType("PositiveInt", int)
+
+    @simple_unstructure
+    def unstructure_positive_int(val):
+        if val <= 0:
+            raise UnstructuringError("The value must be positive")
+        return f"+{val}"
+
+    # Note that a union with a newtype is a `typing.Union`, not a `types.UnionType`
+    unstructurer = Unstructurer(
+        lookup_handlers={
+            Union: unstructure_as_union,
+            list: unstructure_as_list,
+            PositiveInt: unstructure_positive_int,
+            int: unstructure_as_int,
+        }
+    )
+
+    # The first variant that succeeds is used, even if the previous value
+    # of the same type was unstructured as a different variant.
+    assert unstructurer.unstructure_as(PositiveInt | int, -1) == -1
+    assert unstructurer.unstructure_as(PositiveInt | int, 1) == "+1"
+
+    # Unions with the same variants in a different order compare equal,
+    # but the variants must still be tried in the order of each particular union.
+    assert unstructurer.unstructure_as(int | PositiveInt, 1) == 1
+    assert unstructurer.unstructure_as(list[PositiveInt | int], [1]) == ["+1"]
+    assert unstructurer.unstructure_as(list[int | PositiveInt], [1]) == [1]
+
+
 def test_unstructure_as_tuple():
     unstructurer = Unstructurer(
         lookup_handlers={
@@ -185,6 +219,14 @@ def test_unstructure_as_tuple():
     )
     assert_exception_matches(exc.value, expected)
 
+    with pytest.raises(UnstructuringError) as exc:
+        unstructurer.unstructure_as(tuple[int, ...], [1, "a"])
+    expected = UnstructuringError(
+        r"Cannot unstructure as tuple\[int, \.\.\.\]",
+        [(ListElem(1), UnstructuringError("The value must be of type `int`"))],
+    )
+    assert_exception_matches(exc.value, expected)
+
 
 def test_unstructure_as_list():
     unstructurer = Unstructurer(
@@ -243,6 +285,52 @@ def test_unstructure_as_dict():
     assert_exception_matches(exc.value, expected)
 
 
+def test_unstructure_as_nested_collections_error():
+    unstructured = []
+
+    @simple_unstructure
+    def unstructure_as_recorded_int(val):
+        unstructured.append(val)
+        if not isinstance(val, int):
+            raise UnstructuringError("The value must be of type `int`")
+        return val
+
+    unstructurer = Unstructurer(
+        lookup_handlers={
+            list: unstructure_as_list,
+            tuple: unstructure_as_tuple,
+            dict: unstructure_as_dict,
+            int: unstructure_as_recorded_int,
+        },
+        sequential_handlers=[UnstructureDataclassToList()],
+    )
+
+    @dataclass
+    class Container:
+        x: int
+        y: list[int]
+
+    # Every element is only unstructured once, even if the error propagates through several levels
+    with pytest.raises(UnstructuringError):
+        unstructurer.unstructure_as(list[list[int]], [[1, 2], [3, "a"], [4]])
+    assert unstructured == [1, 2, 3, "a", 4]
+
+    unstructured.clear()
+    with pytest.raises(UnstructuringError):
+        unstructurer.unstructure_as(tuple[int, tuple[int, ...]], (1, (2, "a")))
+    assert unstructured == [1, 2, "a"]
+
+    unstructured.clear()
+    with pytest.raises(UnstructuringError):
+        unstructurer.unstructure_as(dict[int, list[int]], {1: [2, "a"], 3: [4]})
+    assert unstructured == [1, 2, "a", 3, 4]
+
+    unstructured.clear()
+    with pytest.raises(UnstructuringError):
+        unstructurer.unstructure_as(list[Container], [Container(x=1, y=[2, "a"])])
+    assert unstructured == [1, 2, "a"]
+
+
 def test_unstructure_dataclass_to_dict():
     unstructurer = Unstructurer(
         lookup_handlers={int: unstructure_as_int, str: unstructure_as_str},